@@ -113,6 +113,13 @@ class ToolRegistry:
         except Exception as e:
             return f"Error executing {name}: {str(e)}" + _HINT
 
+    async def aclose(self) -> None:
+        """Release resources held by tools that define ``aclose()`` (e.g. pooled HTTP clients)."""
+        for tool in self._tools.values():
+            aclose = getattr(tool, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
     @property
     def tool_names(self) -> list[str]:
         """Get list of registered tool names."""
@@ -0,0 +1,124 @@
+"""Pure text helpers for the web tools: HTML stripping, markdown rendering, result formatting.
+
+Kept free of I/O and fully annotated so it can be compiled with mypyc
+(``python -m mypyc nanobot/agent/tools/web_text.py``).  A compiled extension
+next to this file takes precedence on import; otherwise this pure-Python
+module is used unchanged.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from typing import Any
+
+import lxml.html  # type: ignore[import-untyped]
+from lxml import etree  # type: ignore[import-untyped]
+
+# Script/style blocks and bare tags share the leading "<", so one alternation strips
+# both in a single scan; no backreferences, so the pattern also stays RE2-compatible.
+_RE_STRIP = re.compile(r"<(?:script[\s\S]*?</script>|style[\s\S]*?</style>|[^>]+>)", re.I)
+_PRUNE_TAGS = ("script", "style", "svg", "noscript")
+_PRUNE_PARSER = etree.HTMLParser(remove_comments=True, remove_blank_text=True)
+_MD_BLOCK_TAGS = frozenset({"p", "div", "section", "article"})
+_MD_HEADING_TAGS = {f"h{i}": i for i in range(1, 7)}
+
+
+def strip_tags(text: str) -> str:
+    """Remove HTML tags and decode entities."""
+    return html.unescape(_RE_STRIP.sub('', text)).strip()
+
+
+def normalize(text: str) -> str:
+    """Normalize whitespace."""
+    text = "\n".join(" ".join(line.split()) for line in text.split("\n"))
+    while "\n\n\n" in text:
+        text = text.replace("\n\n\n", "\n\n")
+    return text.strip()
+
+
+def looks_like_html(body: bytes) -> bool:
+    """Sniff the first bytes of an untyped body for an HTML document signature."""
+    return body[:256].lstrip().lower().startswith((b"<!doctype", b"<html"))
+
+
+def prune_html(html_content: str) -> str:
+    """Drop scripts, styles, SVG, comments and blank text so readability scores a smaller tree."""
+    try:
+        root = etree.fromstring(html_content, _PRUNE_PARSER)
+    except (etree.LxmlError, ValueError):
+        return html_content
+    if root is None:
+        return html_content
+    etree.strip_elements(root, *_PRUNE_TAGS, with_tail=False)
+    return etree.tostring(root, encoding="unicode", method="html")
+
+
+def html_to_markdown(html_content: str) -> str:
+    """Convert HTML to markdown with a single walk over the parsed tree."""
+    try:
+        root = lxml.html.fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        return normalize(strip_tags(html_content))
+    parts: list[str] = []
+    _render_markdown(root, parts)
+    return normalize("".join(parts))
+
+
+def html_to_text(html_content: str) -> str:
+    """Extract plain text from HTML in one pass over the parsed tree."""
+    try:
+        root = lxml.html.fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        return strip_tags(html_content)
+    etree.strip_elements(root, "script", "style", with_tail=False)
+    return root.text_content().strip()
+
+
+def _render_markdown(el: Any, out: list[str]) -> None:
+    """Append the markdown rendering of *el* (excluding its tail) to *out*."""
+    tag = el.tag.lower() if isinstance(el.tag, str) else ""
+    if tag in ("script", "style"):
+        return
+    if tag in ("br", "hr"):
+        out.append("\n")
+        return
+    if tag == "a" and el.get("href"):
+        out.append(f"[{el.text_content().strip()}]({el.get('href')})")
+        return
+    if tag in _MD_HEADING_TAGS or tag == "li":
+        inner: list[str] = []
+        _render_children(el, inner)
+        text = "".join(inner).strip()
+        if tag == "li":
+            out.append(f"\n- {text}")
+        else:
+            out.append(f"\n{'#' * _MD_HEADING_TAGS[tag]} {text}\n")
+        return
+    _render_children(el, out)
+    if tag in _MD_BLOCK_TAGS:
+        out.append("\n\n")
+
+
+def _render_children(el: Any, out: list[str]) -> None:
+    """Append the text and rendered children of *el* to *out*; comments are skipped."""
+    if isinstance(el.tag, str) and el.text:
+        out.append(el.text)
+    for child in el:
+        _render_markdown(child, out)
+        if child.tail:
+            out.append(child.tail)
+
+
+def format_results(query: str, items: list[dict[str, Any]], n: int) -> str:
+    """Format provider results into shared plaintext output."""
+    if not items:
+        return f"No results for: {query}"
+    lines = [f"Results for: {query}\n"]
+    for i, item in enumerate(items[:n], 1):
+        title = normalize(strip_tags(item.get("title", "")))
+        snippet = normalize(strip_tags(item.get("content", "")))
+        lines.append(f"{i}. {title}\n   {item.get('url', '')}")
+        if snippet:
+            lines.append(f"   {snippet}")
+    return "\n".join(lines)
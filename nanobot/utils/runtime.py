@@ -66,6 +66,12 @@ def external_lookup_signature(tool_name: str, arguments: dict[str, Any]) -> str
         url = str(arguments.get("url") or "").strip()
         if url:
             return f"web_fetch:{url.lower()}"
+    if tool_name == "web_fetch_batch":
+        urls = arguments.get("urls")
+        if isinstance(urls, list):
+            keys = sorted({str(u).strip().lower() for u in urls if str(u or "").strip()})
+            if keys:
+                return "web_fetch_batch:" + " ".join(keys)
     if tool_name == "web_search":
         query = str(arguments.get("query") or arguments.get("search_term") or "").strip()
         if query:
@@ -16,6 +16,7 @@ _TOOL_FORMATS: dict[str, tuple[list[str], str, bool, bool]] = {
     "exec":       (["command"],                        "$ {}",        False, True),
     "web_search": (["query"],                          'search "{}"', False, False),
     "web_fetch":  (["url"],                            "fetch {}",    True,  False),
+    "web_fetch_batch": (["urls"],                      "fetch {}",    True,  False),
     "list_dir":   (["path"],                           "ls {}",       True,  False),
 }
 
@@ -65,8 +66,8 @@ def _get_args(tc) -> dict:
     return {}
 
 
-def _extract_arg(tc, key_args: list[str]) -> str | None:
-    """Extract the first available value from preferred key names."""
+def _extract_arg(tc, key_args: list[str]) -> str | list[str] | None:
+    """Extract the first available value (a string or list of strings) from preferred key names."""
     args = _get_args(tc)
     if not isinstance(args, dict):
         return None
@@ -74,6 +75,8 @@ def _extract_arg(tc, key_args: list[str]) -> str | None:
         val = args.get(key)
         if isinstance(val, str) and val:
             return val
+        if isinstance(val, list) and val and all(isinstance(v, str) and v for v in val):
+            return val
     for val in args.values():
         if isinstance(val, str) and val:
             return val
@@ -85,11 +88,12 @@ def _fmt_known(tc, fmt: tuple) -> str:
     val = _extract_arg(tc, fmt[0])
     if val is None:
         return tc.name
+    vals = val if isinstance(val, list) else [val]
     if fmt[2]:  # is_path
-        val = abbreviate_path(val)
+        vals = [abbreviate_path(v) for v in vals]
     elif fmt[3]:  # is_command
-        val = _abbreviate_command(val)
-    return fmt[1].format(val)
+        vals = [_abbreviate_command(v) for v in vals]
+    return fmt[1].format(", ".join(vals))
 
 
 def _abbreviate_command(cmd: str, max_len: int = 40) -> str:
@@ -883,6 +883,16 @@ async def test_runner_blocks_repeated_external_fetches():
     assert "repeated external lookup blocked" in blocked_tool_message["content"]
 
 
+def test_repeated_batch_fetch_signature_ignores_url_order_and_case():
+    from nanobot.utils.runtime import external_lookup_signature
+
+    first = external_lookup_signature("web_fetch_batch", {"urls": ["https://b.example", "https://A.example"]})
+    second = external_lookup_signature("web_fetch_batch", {"urls": ["https://a.example", "https://b.example"]})
+    assert first is not None
+    assert first == second
+    assert external_lookup_signature("web_fetch_batch", {"urls": []}) is None
+
+
 @pytest.mark.asyncio
 async def test_loop_max_iterations_message_stays_stable(tmp_path):
     loop = _make_loop(tmp_path)
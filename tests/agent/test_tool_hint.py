@@ -107,6 +107,10 @@ class TestToolHintKnownTools:
         result = _hint([_tc("web_fetch", {"url": "https://example.com/page"})])
         assert result == "fetch https://example.com/page"
 
+    def test_web_fetch_batch_lists_urls(self):
+        result = _hint([_tc("web_fetch_batch", {"urls": ["https://a.example/x", "https://b.example/y"]})])
+        assert result == "fetch https://a.example/x, https://b.example/y"
+
 
 class TestToolHintMCP:
     """Test MCP tools are abbreviated to server::tool format."""
@@ -0,0 +1,51 @@
+"""Tests for the web_fetch_batch tool."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from nanobot.agent.tools.web import WebFetchBatchTool, WebFetchTool
+
+
+class _StubFetch(WebFetchTool):
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def execute(self, url, extractMode="markdown", maxChars=None, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if url.endswith("/boom"):
+                raise RuntimeError("boom")
+            if url.endswith(".png"):
+                return [{"type": "image_url", "image_url": {"url": "data:image/png;base64,"}}]
+            return json.dumps({"url": url, "text": f"content of {url}", "extractor": "stub"})
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_results_in_input_order():
+    tool = WebFetchBatchTool(_StubFetch())
+    urls = ["https://a.example", "https://b.example/boom", "https://c.example/x.png"]
+    data = json.loads(await tool.execute(urls=urls))
+
+    assert [d["url"] for d in data] == urls
+    assert data[0]["text"] == "content of https://a.example"
+    assert data[1]["error"] == "boom"
+    assert "image" in data[2]["error"]
+
+
+@pytest.mark.asyncio
+async def test_batch_respects_max_concurrency():
+    fetch = _StubFetch(delay=0.01)
+    tool = WebFetchBatchTool(fetch)
+    await tool.execute(urls=[f"https://{i}.example" for i in range(8)], maxConcurrency=3)
+    assert fetch.peak == 3
@@ -0,0 +1,73 @@
+"""Tests for the web_fetch per-instance result cache."""
+
+from __future__ import annotations
+
+import json
+import socket
+from unittest.mock import patch
+
+import pytest
+
+import nanobot.agent.tools.web as web_mod
+from nanobot.agent.tools.web import WebFetchTool
+
+
+def _fake_resolve_public(hostname, port, family=0, type_=0):
+    return [(socket.AF_INET, socket.SOCK_STREAM, 0, "", ("93.184.216.34", 0))]
+
+
+class _CountingFetch(WebFetchTool):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def _fetch_and_extract(self, url, extract_mode, max_chars):
+        self.calls.append((url, extract_mode, max_chars))
+        if url.endswith("/missing"):
+            return json.dumps({"url": url, "error": "404"}), False
+        return json.dumps({"url": url, "text": f"call {len(self.calls)}"}), True
+
+
+@pytest.fixture(autouse=True)
+def _public_dns():
+    with patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_repeated_fetch_is_served_from_cache():
+    tool = _CountingFetch()
+    first = await tool.execute(url="https://example.com/a")
+    second = await tool.execute(url="https://example.com/a")
+    assert first == second
+    assert len(tool.calls) == 1
+
+    await tool.execute(url="https://example.com/a", extractMode="text")
+    assert len(tool.calls) == 2
+
+    tool.clear_cache()
+    await tool.execute(url="https://example.com/a")
+    assert len(tool.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    tool = _CountingFetch()
+    await tool.execute(url="https://example.com/missing")
+    await tool.execute(url="https://example.com/missing")
+    assert len(tool.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_and_evicts_least_recent(monkeypatch):
+    monkeypatch.setattr(web_mod, "_FETCH_CACHE_SIZE", 2)
+    tool = _CountingFetch()
+    for path in ("a", "b", "a", "c"):
+        await tool.execute(url=f"https://example.com/{path}")
+    # "b" was least recently used when "c" arrived
+    await tool.execute(url="https://example.com/b")
+    assert [c[0][-1] for c in tool.calls] == ["a", "b", "c", "b"]
+
+    monkeypatch.setattr(web_mod, "_FETCH_CACHE_TTL", 0.0)
+    await tool.execute(url="https://example.com/b")
+    assert len(tool.calls) == 5
@@ -0,0 +1,130 @@
+"""Tests for web_fetch HTML → markdown/text extraction helpers."""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import nanobot.agent.tools.web as web_mod
+from nanobot.agent.tools.web import WebFetchTool, _extract_trafilatura
+from nanobot.agent.tools.web_text import looks_like_html, normalize, prune_html, strip_tags
+
+
+def test_to_markdown_renders_headings_links_and_lists():
+    html = (
+        "<html><body><div>"
+        '<h2>Title <a href="/docs">docs</a></h2>'
+        "<p>Hello &amp; <b>world</b><br/>next line</p>"
+        '<ul><li>one <a href="https://a.example">A</a></li><li>two</li></ul>'
+        "</div></body></html>"
+    )
+    md = WebFetchTool()._to_markdown(html)
+    assert "## Title [docs](/docs)" in md
+    assert "Hello & world\nnext line" in md
+    assert "- one [A](https://a.example)\n- two" in md
+
+
+def test_to_markdown_drops_scripts_styles_and_comments():
+    html = (
+        "<div><style>p { color: red }</style><script>var x = 1;</script>"
+        "<!-- hidden --><p>visible</p></div>"
+    )
+    assert WebFetchTool()._to_markdown(html) == "visible"
+
+
+def test_to_markdown_handles_empty_input():
+    assert WebFetchTool()._to_markdown("") == ""
+
+
+def test_looks_like_html_sniffs_leading_bytes_only():
+    assert looks_like_html(b"  \n<!DOCTYPE html><html></html>")
+    assert looks_like_html(b"<HTML><body>x</body></HTML>")
+    assert not looks_like_html(b"plain text" + b"<html>" * 100)
+
+
+def test_to_text_matches_regex_stripping():
+    html = "<div><script>x()</script><p>Hello &amp; <b>world</b></p><p>again</p></div>"
+    assert WebFetchTool()._to_text(html) == "Hello & worldagain"
+    assert WebFetchTool()._to_text("") == ""
+
+
+def test_extract_trafilatura_skipped_when_not_installed(monkeypatch):
+    monkeypatch.setattr(web_mod, "trafilatura", None)
+    assert _extract_trafilatura("<p>x</p>", "markdown") is None
+
+
+def test_trafilatura_is_imported_on_first_use(monkeypatch):
+    monkeypatch.setattr(web_mod, "trafilatura", web_mod._UNLOADED)
+    monkeypatch.setitem(sys.modules, "trafilatura", None)  # simulate the extra not being installed
+    assert _extract_trafilatura("<p>x</p>", "markdown") is None
+    assert web_mod.trafilatura is None
+
+
+class FakeTrafilatura:
+    title = None
+
+    @staticmethod
+    def load_html(html):
+        return html
+
+    @classmethod
+    def extract_metadata(cls, tree):
+        return SimpleNamespace(title=cls.title)
+
+
+def test_extract_trafilatura_maps_extract_mode(monkeypatch):
+    calls = {}
+
+    class FakeExtract(FakeTrafilatura):
+        @staticmethod
+        def extract(html, **kwargs):
+            calls.update(kwargs)
+            return "Body"
+
+    monkeypatch.setattr(web_mod, "trafilatura", FakeExtract)
+    assert _extract_trafilatura("<p>x</p>", "text") == "Body"
+    assert calls["output_format"] == "txt"
+    assert calls["include_links"] is False
+
+    _extract_trafilatura("<p>x</p>", "markdown")
+    assert calls["output_format"] == "markdown"
+    assert calls["include_links"] is True
+
+
+def test_extract_trafilatura_prepends_title_like_readability(monkeypatch):
+    class FakeTitled(FakeTrafilatura):
+        title = "Page Title"
+
+        @staticmethod
+        def extract(html, **kwargs):
+            return "Body"
+
+    monkeypatch.setattr(web_mod, "trafilatura", FakeTitled)
+    assert _extract_trafilatura("<p>x</p>", "markdown") == "# Page Title\n\nBody"
+
+
+def test_strip_tags_drops_script_style_blocks_and_tags():
+    html = (
+        "<div><SCRIPT type='x'>if (a < b) {}</SCRIPT><style>p > a {}</style>"
+        "<p>Hello &amp; <b>world</b></p><script>unterminated</div>"
+    )
+    assert strip_tags(html) == "Hello & worldunterminated"
+
+
+def test_normalize_collapses_spaces_and_blank_lines():
+    assert normalize("  a  \t b \n\n \n\n\n\nc  d\n") == "a b\n\nc d"
+
+
+def test_prune_html_keeps_content_and_title():
+    html = (
+        "<html><head><title>T</title><style>p{}</style></head><body>"
+        "<!-- note --><svg><path d='M0'/></svg><script>var a;</script>"
+        "<p>Body &amp; text</p><noscript>enable js</noscript>tail</body></html>"
+    )
+    pruned = prune_html(html)
+    assert "<title>T</title>" in pruned
+    assert "<p>Body &amp; text</p>" in pruned
+    assert "tail" in pruned
+    for dropped in ("note", "<svg", "var a", "enable js", "p{}"):
+        assert dropped not in pruned
+    assert prune_html("") == ""
@@ -6,6 +6,7 @@ import json
 import socket
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from nanobot.agent.tools.web import WebFetchTool
@@ -47,21 +48,28 @@ async def test_web_fetch_result_contains_untrusted_flag():
 
     fake_html = "<html><head><title>Test</title></head><body><p>Hello world</p></body></html>"
 
-    import httpx
-
     class FakeResponse:
         status_code = 200
         url = "https://example.com/page"
         text = fake_html
+        encoding = "utf-8"
         headers = {"content-type": "text/html"}
         def raise_for_status(self): pass
         def json(self): return {}
+        async def aiter_bytes(self):
+            yield fake_html.encode()
+        async def __aenter__(self): return self
+        async def __aexit__(self, *exc): return False
 
     async def _fake_get(self, url, **kwargs):
         return FakeResponse()
 
+    def _fake_stream(self, method, url, **kwargs):
+        return FakeResponse()
+
     with patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public), \
-         patch("httpx.AsyncClient.get", _fake_get):
+         patch("httpx.AsyncClient.get", _fake_get), \
+         patch("httpx.AsyncClient.stream", _fake_stream):
         result = await tool.execute(url="https://example.com/page")
 
     data = json.loads(result)
@@ -100,7 +108,7 @@ async def test_web_fetch_blocks_private_redirect_before_returning_image(monkeypa
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def stream(self, method, url, headers=None):
+        def stream(self, method, url, headers=None, **kwargs):
             return FakeStreamResponse()
 
     monkeypatch.setattr("nanobot.agent.tools.web.httpx.AsyncClient", FakeClient)
@@ -111,3 +119,137 @@ async def test_web_fetch_blocks_private_redirect_before_returning_image(monkeypa
     data = json.loads(result)
     assert "error" in data
     assert "redirect blocked" in data["error"].lower()
+
+
+@pytest.mark.asyncio
+async def test_web_fetch_caps_streamed_body(monkeypatch):
+    """Non-HTML bodies stop downloading at ~4 bytes per requested output char."""
+    tool = WebFetchTool()
+    chunks_read = []
+
+    class FakeStreamResponse:
+        status_code = 200
+        url = "https://example.com/big.txt"
+        encoding = "utf-8"
+        headers = {"content-type": "text/plain"}
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            return None
+
+        async def aiter_bytes(self):
+            for _ in range(1000):
+                chunks_read.append(1)
+                yield b"x" * 1024
+
+    class FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def stream(self, method, url, **kwargs):
+            return FakeStreamResponse()
+
+        async def get(self, url, **kwargs):
+            raise httpx.ConnectError("jina unavailable")
+
+    monkeypatch.setattr("nanobot.agent.tools.web.httpx.AsyncClient", FakeClient)
+
+    with patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public):
+        result = await tool.execute(url="https://example.com/big.txt", maxChars=1000)
+
+    data = json.loads(result)
+    assert data["extractor"] == "raw"
+    assert data["truncated"] is True
+    assert len(chunks_read) <= 5
+
+
+@pytest.mark.asyncio
+async def test_web_fetch_does_not_retry_a_host_that_failed_to_connect(monkeypatch):
+    tool = WebFetchTool()
+    attempts = []
+
+    class FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def stream(self, method, url, **kwargs):
+            attempts.append(url)
+            raise httpx.ConnectError("connection refused")
+
+        async def get(self, url, **kwargs):
+            raise httpx.ConnectError("jina unavailable")
+
+    async def fake_sleep(delay):
+        raise AssertionError("should not back off and retry")
+
+    monkeypatch.setattr("nanobot.agent.tools.web.httpx.AsyncClient", FakeClient)
+    monkeypatch.setattr("nanobot.agent.tools.web.asyncio.sleep", fake_sleep)
+
+    with patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public):
+        result = await tool.execute(url="https://example.com/page")
+
+    assert "error" in json.loads(result)
+    assert len(attempts) == 2  # image pre-fetch + a single readability attempt
+
+
+@pytest.mark.asyncio
+async def test_web_fetch_keeps_large_json_integers_exact(monkeypatch):
+    tool = WebFetchTool()
+    body = b'{"n": 18446744073709551616, "m": -123456789012345678901234567890}'
+
+    class FakeStreamResponse:
+        status_code = 200
+        url = "https://example.com/data.json"
+        encoding = "utf-8"
+        headers = {"content-type": "application/json"}
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            return None
+
+        async def aiter_bytes(self):
+            yield body
+
+    class FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def stream(self, method, url, **kwargs):
+            return FakeStreamResponse()
+
+        async def get(self, url, **kwargs):
+            raise httpx.ConnectError("jina unavailable")
+
+    monkeypatch.setattr("nanobot.agent.tools.web.httpx.AsyncClient", FakeClient)
+
+    with patch("nanobot.security.network.socket.getaddrinfo", _fake_resolve_public):
+        result = await tool.execute(url="https://example.com/data.json")
+
+    data = json.loads(result)
+    assert data["extractor"] == "json"
+    assert "18446744073709551616" in data["text"]
+    assert "-123456789012345678901234567890" in data["text"]
+
+
+@pytest.mark.asyncio
+async def test_web_fetch_client_does_not_keep_cookies():
+    tool = WebFetchTool()
+    client = tool._http.get()
+    response = httpx.Response(
+        200,
+        headers={"set-cookie": "sid=secret; Path=/"},
+        request=httpx.Request("GET", "https://example.com/"),
+    )
+    client.cookies.extract_cookies(response)
+    assert len(client.cookies.jar) == 0
+    await tool.aclose()
@@ -3,7 +3,7 @@
 import httpx
 import pytest
 
-from nanobot.agent.tools.web import WebSearchTool
+from nanobot.agent.tools.web import WebSearchTool, _validate_url
 from nanobot.config.schema import WebSearchConfig
 
 
@@ -39,14 +39,14 @@ def test_brave_without_api_key_is_treated_as_duckduckgo_for_concurrency(monkeypa
 
 @pytest.mark.asyncio
 async def test_brave_search(monkeypatch):
-    async def mock_get(self, url, **kw):
+    async def mock_get(self, method, url, **kw):
         assert "brave" in url
         assert kw["headers"]["X-Subscription-Token"] == "brave-key"
         return _response(json={
             "web": {"results": [{"title": "NanoBot", "url": "https://example.com", "description": "AI assistant"}]}
         })
 
-    monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
     tool = _tool(provider="brave", api_key="brave-key")
     result = await tool.execute(query="nanobot", count=1)
     assert "NanoBot" in result
@@ -55,14 +55,14 @@ async def test_brave_search(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_tavily_search(monkeypatch):
-    async def mock_post(self, url, **kw):
+    async def mock_post(self, method, url, **kw):
         assert "tavily" in url
         assert kw["headers"]["Authorization"] == "Bearer tavily-key"
         return _response(json={
             "results": [{"title": "OpenClaw", "url": "https://openclaw.io", "content": "Framework"}]
         })
 
-    monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_post)
     tool = _tool(provider="tavily", api_key="tavily-key")
     result = await tool.execute(query="openclaw")
     assert "OpenClaw" in result
@@ -71,13 +71,13 @@ async def test_tavily_search(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_searxng_search(monkeypatch):
-    async def mock_get(self, url, **kw):
+    async def mock_get(self, method, url, **kw):
         assert "searx.example" in url
         return _response(json={
             "results": [{"title": "Result", "url": "https://example.com", "content": "SearXNG result"}]
         })
 
-    monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
     tool = _tool(provider="searxng", base_url="https://searx.example")
     result = await tool.execute(query="test")
     assert "Result" in result
@@ -122,14 +122,14 @@ async def test_brave_fallback_to_duckduckgo_when_no_key(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_jina_search(monkeypatch):
-    async def mock_get(self, url, **kw):
+    async def mock_get(self, method, url, **kw):
         assert "s.jina.ai" in str(url)
         assert kw["headers"]["Authorization"] == "Bearer jina-key"
         return _response(json={
             "data": [{"title": "Jina Result", "url": "https://jina.ai", "content": "AI search"}]
         })
 
-    monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
     tool = _tool(provider="jina", api_key="jina-key")
     result = await tool.execute(query="test")
     assert "Jina Result" in result
@@ -138,7 +138,7 @@ async def test_jina_search(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_kagi_search(monkeypatch):
-    async def mock_get(self, url, **kw):
+    async def mock_get(self, method, url, **kw):
         assert "kagi.com/api/v0/search" in url
         assert kw["headers"]["Authorization"] == "Bot kagi-key"
         assert kw["params"] == {"q": "test", "limit": 2}
@@ -149,7 +149,7 @@ async def test_kagi_search(monkeypatch):
             ]
         })
 
-    monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
     tool = _tool(provider="kagi", api_key="kagi-key")
     result = await tool.execute(query="test", count=2)
     assert "Kagi Result" in result
@@ -167,11 +167,11 @@ async def test_unknown_provider():
 
 @pytest.mark.asyncio
 async def test_default_provider_is_brave(monkeypatch):
-    async def mock_get(self, url, **kw):
+    async def mock_get(self, method, url, **kw):
         assert "brave" in url
         return _response(json={"web": {"results": []}})
 
-    monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
     tool = _tool(provider="", api_key="test-key")
     result = await tool.execute(query="test")
     assert "No results" in result
@@ -210,7 +210,7 @@ async def test_jina_422_falls_back_to_duckduckgo(monkeypatch):
         def text(self, query, max_results=5):
             return [{"title": "Fallback", "href": "https://ddg.example", "body": "DuckDuckGo fallback"}]
 
-    async def mock_get(self, url, **kw):
+    async def mock_get(self, method, url, **kw):
         assert "s.jina.ai" in str(url)
         raise httpx.HTTPStatusError(
             "422 Unprocessable Entity",
@@ -218,7 +218,7 @@ async def test_jina_422_falls_back_to_duckduckgo(monkeypatch):
             response=httpx.Response(422, request=httpx.Request("GET", str(url))),
         )
 
-    monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
     monkeypatch.setattr("ddgs.DDGS", MockDDGS)
 
     tool = _tool(provider="jina", api_key="jina-key")
@@ -247,14 +247,14 @@ async def test_kagi_fallback_to_duckduckgo_when_no_key(monkeypatch):
 async def test_jina_search_uses_path_encoded_query(monkeypatch):
     calls = {}
 
-    async def mock_get(self, url, **kw):
+    async def mock_get(self, method, url, **kw):
         calls["url"] = str(url)
         calls["params"] = kw.get("params")
         return _response(json={
             "data": [{"title": "Jina Result", "url": "https://jina.ai", "content": "AI search"}]
         })
 
-    monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
     tool = _tool(provider="jina", api_key="jina-key")
     await tool.execute(query="hello world")
     assert calls["url"].rstrip("/") == "https://s.jina.ai/hello%20world"
@@ -281,3 +281,194 @@ async def test_duckduckgo_timeout_returns_error(monkeypatch):
     result = await tool.execute(query="test")
     gate.set()
     assert "Error" in result
+
+
+@pytest.mark.asyncio
+async def test_search_reuses_pooled_client_until_closed(monkeypatch):
+    clients = []
+
+    async def mock_get(self, method, url, **kw):
+        clients.append(self)
+        return _response(json={"web": {"results": []}})
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
+    tool = _tool(provider="brave", api_key="brave-key")
+    await tool.execute(query="one")
+    await tool.execute(query="two")
+    assert clients[0] is clients[1]
+
+    await tool.aclose()
+    assert clients[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_auto_returns_first_successful_provider(monkeypatch):
+    monkeypatch.setenv("BRAVE_API_KEY", "brave-key")
+    monkeypatch.setenv("TAVILY_API_KEY", "tavily-key")
+
+    async def mock_request(self, method, url, **kw):
+        if method == "GET":
+            raise httpx.ConnectError("brave down")
+        assert kw["headers"]["Authorization"] == "Bearer tavily-key"
+        return _response(json={
+            "results": [{"title": "Tavily Result", "url": "https://tavily.example", "content": "ok"}]
+        })
+
+    async def fake_sleep(delay):
+        pass
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_request)
+    monkeypatch.setattr("nanobot.agent.tools.web.asyncio.sleep", fake_sleep)
+    tool = _tool(provider="auto")
+    result = await tool.execute(query="test")
+    assert "Tavily Result" in result
+
+
+@pytest.mark.asyncio
+async def test_auto_without_keys_falls_back_to_duckduckgo(monkeypatch):
+    class MockDDGS:
+        def __init__(self, **kw):
+            pass
+
+        def text(self, query, max_results=5):
+            return [{"title": "Fallback", "href": "https://ddg.example", "body": "DuckDuckGo fallback"}]
+
+    monkeypatch.setattr("ddgs.DDGS", MockDDGS)
+    monkeypatch.delenv("BRAVE_API_KEY", raising=False)
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+
+    tool = _tool(provider="auto")
+    assert tool.exclusive is True
+    result = await tool.execute(query="test")
+    assert "Fallback" in result
+
+
+@pytest.mark.parametrize(
+    ("url", "ok"),
+    [
+        ("https://searx.example/search", True),
+        ("HTTP://searx.example", True),
+        ("http:///search", False),
+        ("http://?q=1", False),
+        ("http://\n/search", False),
+        ("ftp://searx.example", False),
+        ("not-a-url", False),
+        ("http://example\uff03.com/search", False),
+    ],
+)
+def test_validate_url(url, ok):
+    assert _validate_url(url)[0] is ok
+
+
+@pytest.mark.asyncio
+async def test_search_retries_transient_errors(monkeypatch):
+    statuses = [503, 429, 200]
+    delays = []
+
+    async def mock_get(self, method, url, **kw):
+        status = statuses.pop(0)
+        if status != 200:
+            r = httpx.Response(status, headers={"Retry-After": "2"} if status == 429 else {})
+            r._request = httpx.Request("GET", url)
+            return r
+        return _response(json={
+            "web": {"results": [{"title": "Recovered", "url": "https://example.com", "description": ""}]}
+        })
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
+    monkeypatch.setattr("nanobot.agent.tools.web.asyncio.sleep", fake_sleep)
+    tool = _tool(provider="brave", api_key="brave-key")
+    result = await tool.execute(query="test")
+    assert "Recovered" in result
+    assert len(delays) == 2
+    assert delays[1] == 2.0  # Retry-After is honoured
+
+
+@pytest.mark.asyncio
+async def test_search_stops_retrying_when_retry_after_is_too_long(monkeypatch):
+    calls = []
+
+    async def mock_get(self, method, url, **kw):
+        calls.append(url)
+        r = httpx.Response(429, headers={"Retry-After": "60"})
+        r._request = httpx.Request(method, url)
+        return r
+
+    async def fake_sleep(delay):
+        raise AssertionError("should not wait out a long Retry-After")
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
+    monkeypatch.setattr("nanobot.agent.tools.web.asyncio.sleep", fake_sleep)
+    tool = _tool(provider="brave", api_key="brave-key")
+    result = await tool.execute(query="test")
+    assert result.startswith("Error") and "429" in result
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_retries_failed_connections(monkeypatch):
+    attempts = []
+
+    async def mock_get(self, method, url, **kw):
+        attempts.append(url)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("connection refused")
+        return _response(json={"web": {"results": []}})
+
+    async def fake_sleep(delay):
+        pass
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
+    monkeypatch.setattr("nanobot.agent.tools.web.asyncio.sleep", fake_sleep)
+    tool = _tool(provider="brave", api_key="brave-key")
+    assert "No results" in await tool.execute(query="test")
+    assert len(attempts) == 3
+
+
+@pytest.mark.asyncio
+async def test_search_does_not_retry_connect_timeouts(monkeypatch):
+    attempts = []
+
+    async def mock_get(self, method, url, **kw):
+        attempts.append(url)
+        raise httpx.ConnectTimeout("timed out")
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
+    tool = _tool(provider="brave", api_key="brave-key")
+    assert (await tool.execute(query="test")).startswith("Error")
+    assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_honours_environment_proxy(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+    tool = _tool(provider="brave", api_key="brave-key")
+    client = tool._http.get()
+    assert any(t is not None for t in client._mounts.values())
+    await tool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_search_gives_up_after_max_retries(monkeypatch):
+    calls = []
+
+    async def mock_get(self, method, url, **kw):
+        calls.append(url)
+        r = httpx.Response(502)
+        r._request = httpx.Request("GET", url)
+        return r
+
+    async def fake_sleep(delay):
+        pass
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", mock_get)
+    monkeypatch.setattr("nanobot.agent.tools.web.asyncio.sleep", fake_sleep)
+    tool = _tool(provider="brave", api_key="brave-key")
+    result = await tool.execute(query="test")
+    assert result.startswith("Error")
+    assert len(calls) == 4